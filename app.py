@@ -1,15 +1,29 @@
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, session, make_response
 import os
 import time
+from contextlib import nullcontext
 from functools import wraps
 import hashlib
 import google.generativeai as genai
 import pdfplumber
 import google.api_core.exceptions # Import specific exceptions
+from werkzeug.exceptions import RequestEntityTooLarge
+from pdf_upload import MAX_UPLOAD_SIZE, PDFUploadRejected, PDFUploadRequest, PDFUploadStream
+import resume_filter
+import fallback_engine
+import resume_profile
+import static_cache
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'render-secret-key-123')
 
+# Stream uploads through PDF validation and reject oversized bodies before they are read
+app.request_class = PDFUploadRequest
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_SIZE
+
+# Train the local resume filter now so the first upload doesn't pay for it
+resume_filter.get_classifier()
+
 # Railway port configuration
 PORT = int(os.environ.get('PORT', 10000))
 
@@ -17,35 +31,57 @@ PORT = int(os.environ.get('PORT', 10000))
 RATE_LIMIT_STORAGE = {}
 RATE_LIMIT_WINDOW = 600  # 10 minutes (increased from 5 minutes)
 RATE_LIMIT_MAX_REQUESTS = 10  # Max 10 requests per 10 minutes per IP (increased from 3)
+ANSWER_PACING_DELAY = 0.3  # Seconds between sequential answer calls to avoid Gemini rate limits
+
+def check_rate_limit(client_ip):
+    """Record a request for client_ip, return seconds to wait if it is over the limit"""
+    current_time = time.time()
+            
+    # Clean old entries
+    RATE_LIMIT_STORAGE[client_ip] = [
+        timestamp for timestamp in RATE_LIMIT_STORAGE.get(client_ip, [])
+        if current_time - timestamp < RATE_LIMIT_WINDOW
+    ]
+            
+    # Check rate limit
+    if len(RATE_LIMIT_STORAGE.get(client_ip, [])) >= RATE_LIMIT_MAX_REQUESTS:
+        # Calculate time until next request is allowed
+        oldest_request_time = RATE_LIMIT_STORAGE[client_ip][0]
+        return int(RATE_LIMIT_WINDOW - (current_time - oldest_request_time))
+            
+    # Record this request
+    RATE_LIMIT_STORAGE[client_ip].append(current_time)
+    return None
 
 def rate_limit_decorator(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         client_ip = request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR', 'unknown'))
-        current_time = time.time()
-                
-        # Clean old entries
-        RATE_LIMIT_STORAGE[client_ip] = [
-            timestamp for timestamp in RATE_LIMIT_STORAGE.get(client_ip, [])
-            if current_time - timestamp < RATE_LIMIT_WINDOW
-        ]
-                
-        # Check rate limit
-        if len(RATE_LIMIT_STORAGE.get(client_ip, [])) >= RATE_LIMIT_MAX_REQUESTS:
-            # Calculate time until next request is allowed
-            oldest_request_time = RATE_LIMIT_STORAGE[client_ip][0]
-            time_to_wait = int(RATE_LIMIT_WINDOW - (current_time - oldest_request_time))
-            return render_template('predict.html', 
+        time_to_wait = check_rate_limit(client_ip)
+        if time_to_wait is not None:
+            return render_template('predict.html',
                                  error=f"Too many requests. Please wait {time_to_wait} seconds before making another request.")
                 
-        # Record this request
-        if client_ip not in RATE_LIMIT_STORAGE:
-            RATE_LIMIT_STORAGE[client_ip] = []
-        RATE_LIMIT_STORAGE[client_ip].append(current_time)
-                
         return f(*args, **kwargs)
     return decorated_function
 
+# Rendered pages for the static-content routes and the error pages
+PAGE_CACHE = static_cache.PageCache(os.path.join(app.root_path, app.template_folder))
+
+def render_cached_page(template_name, error=None, status=200):
+    """Render a template once per error message and serve it with ETag/Last-Modified"""
+    entry = PAGE_CACHE.get(template_name, error)
+    if entry is None:
+        entry = PAGE_CACHE.put(template_name, error, render_template(template_name, error=error))
+    body, etag, last_modified = entry
+    response = make_response(body, status)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    if status == 200:
+        # Answers If-None-Match / If-Modified-Since with 304
+        response = response.make_conditional(request)
+    return response
+
 # NEW: Retry decorator for Gemini API calls
 def retry_gemini_api(max_retries=3, initial_delay=1):
     def decorator(f):
@@ -73,7 +109,7 @@ def retry_gemini_api(max_retries=3, initial_delay=1):
 
 @app.route('/')
 def index():
-    return render_template('front.html')
+    return render_cached_page('front.html')
 
 @app.route('/test')
 def test():
@@ -88,13 +124,14 @@ def health():
         'env_vars': {
             'PORT': os.environ.get('PORT', 'Not set'),
             'GEMINI_API_KEY': 'Set' if os.environ.get('GEMINI_API_KEY') else 'Not set'
-        }
+        },
+        'resume_filter': resume_filter.FILTER_STATS
     })
 
 
 @app.route('/predict')
 def predict():
-    return render_template('predict.html')
+    return render_cached_page('predict.html')
 
 @app.route('/generate_questions', methods=['POST'])
 @rate_limit_decorator
@@ -102,159 +139,99 @@ def generate_questions():
     try:
         api_key = os.environ.get('GEMINI_API_KEY')
         if not api_key:
-            return render_template('predict.html', error="API key not configured. Please set GEMINI_API_KEY environment variable.")
+            return render_template('predict.html', error=API_KEY_MISSING_MESSAGE)
+                
+        file, job_title, error = read_upload_form(request.files, request.form)
+        if error:
+            return render_template('predict.html', error=error)
                 
         genai.configure(api_key=api_key)
         model = genai.GenerativeModel("gemini-2.5-flash")
                 
-        if 'pdf_file' not in request.files:
-            return render_template('predict.html', error="No file uploaded")
-                
-        file = request.files['pdf_file']
-        job_title = request.form.get('job_title', '')
-                
-        if not file.filename or not job_title:
-            return render_template('predict.html', error="Please select file and job title")
-                
         # Extract text from PDF with better error handling
-        text_content = ""
         try:
-            with pdfplumber.open(file) as pdf:
-                # Extract text from first 2 pages only to reduce token usage
-                for page in pdf.pages[:2]:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += page_text + "\n"
+            text_content = extract_pdf_text(file)
         except Exception as pdf_error:
             return render_template('predict.html', error=f"Error reading PDF file: {str(pdf_error)}")
                 
-        if not text_content.strip():
-            return render_template('predict.html', error="Could not extract text from PDF. Please ensure it's a readable PDF.")
+        error = check_resume_text(text_content)
+        if error:
+            return render_template('predict.html', error=error)
                 
-        # Limit text content to reduce API usage
-        text_content = text_content[:2500]  # Reduced from 4000
-                
-        # SINGLE API CALL - Combined validation and question generation
-        combined_prompt = f"""
-        Analyze the following resume content and perform two tasks:
-        1. First, determine if this is a valid resume/CV
-        2. If valid, generate exactly 10 relevant interview questions for {job_title}
-        Resume Content: {text_content}
-        RESPONSE FORMAT:
-        VALIDATION: [VALID_RESUME or NOT_RESUME with brief explanation]
-                
-        QUESTIONS:
-        1. [Question 1]
-        2. [Question 2]
-        3. [Question 3]
-        4. [Question 4]
-        5. [Question 5]
-        6. [Question 6]
-        7. [Question 7]
-        8. [Question 8]
-        9. [Question 9]
-        10. [Question 10]
-        Requirements for questions:
-        - Specific to the candidate's experience in the resume
-        - Mix of technical and behavioral questions for {job_title}
-        - Easy to Medium level but fair
-        - Based on actual projects/technologies mentioned
-        """
+        # Extract skills, technologies, roles and projects once per upload
+        profile = resume_profile.build_profile(text_content)
                 
         # Apply retry logic to the API call
         @retry_gemini_api()
         def generate_content_with_retry(model, prompt):
             return model.generate_content(prompt)
 
-        response = generate_content_with_retry(model, combined_prompt)
-        response_text = response.text
-                
-        # Parse validation result
-        if "NOT_RESUME" in response_text:
-            return render_template('predict.html',
-                error="The uploaded document doesn't appear to be a resume. Please upload a valid resume.")
-                
-        # Extract questions
-        questions = []
-        lines = response_text.split('\n')
-        in_questions_section = False
-                
-        for line in lines:
-            line = line.strip()
-            if line.startswith('QUESTIONS:'):
-                in_questions_section = True
-                continue
-                        
-            if in_questions_section and line:
-                # Extract question text after number
-                if line and (line[0].isdigit() or line.startswith('Q')):
-                    if '.' in line:
-                        question = line.split('.', 1)[-1].strip()
-                        if len(question) > 15:
-                            questions.append(question)
-                # Ensure we have exactly 10 questions
-        questions = questions[:10]
+        # SINGLE API CALL - Combined validation and question generation
+        response = generate_content_with_retry(model, build_questions_prompt(job_title, text_content, profile))
                 
-        if len(questions) < 5:
-            return render_template('predict.html',
-                error="Could not generate sufficient questions. Please try with a different resume or job title.")
+        questions, error = questions_from_response(response.text)
+        if error:
+            return render_template('predict.html', error=error)
                 
-        # Store in session with reduced context
-        session['questions'] = questions
-        session['job_title'] = job_title
-        session['resume_text'] = text_content[:1500]  # Reduced storage
+        store_questions(session, questions, job_title, profile, text_content)
                 
         return render_template('questions_result.html',
                               questions=questions,
                               job_title=job_title)
             
-    except google.api_core.exceptions.ResourceExhausted as e:
-        return render_template('predict.html', error="API quota exceeded. Please check your Google Cloud Console for usage limits or try again later.")
-    except google.api_core.exceptions.GoogleAPIError as e:
-        return render_template('predict.html', error=f"Google API error: {str(e)}. Please try again.")
+    except RequestEntityTooLarge:
+        raise # Handled by the 413 error page
     except Exception as e:
-        return render_template('predict.html', error=f"An unexpected error occurred: {str(e)}. Please try again.")
+        error, status = question_error(e)
+        return render_template('predict.html', error=error), status
+
+def extract_pdf_text(file, max_pages=2):
+    """Extract text from the first pages of an uploaded PDF"""
+    text_content = ""
+    stream = file.stream
+    if isinstance(stream, PDFUploadStream):
+        # Memory-mapped view of the spooled upload, no copy of the body
+        source = stream.open_for_parsing()
+    else:
+        source = nullcontext(stream)
+
+    with source as pdf_source, pdfplumber.open(pdf_source) as pdf:
+        # Extract text from first pages only to reduce token usage
+        for page in pdf.pages[:max_pages]:
+            page_text = page.extract_text()
+            if page_text:
+                text_content += page_text + "\n"
+    return text_content
 
 @app.route('/generate_answers', methods=['POST'])
 @rate_limit_decorator
 def generate_answers():
     try:
-        questions = session.get('questions', [])
-        job_title = session.get('job_title', '')
-        resume_text = session.get('resume_text', '')
+        questions, job_title, profile, candidate_context = load_answer_context(session)
         
         if not questions:
-            return jsonify({'error': 'No questions found. Please generate questions first.'})
+            return jsonify({'error': NO_QUESTIONS_MESSAGE})
         
+        # Without an API key every answer comes from the local fallback engine
         api_key = os.environ.get('GEMINI_API_KEY')
-        if not api_key:
-            return jsonify({'error': 'API key not configured on server.'})
-        
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel("gemini-2.5-flash")
+        llm_available = bool(api_key)
+        if llm_available:
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel("gemini-2.5-flash")
         
         # Process each question individually to guarantee all answers
         answers = {}
+        fallback_count = 0
         
         for i, question in enumerate(questions[:10], 1):
+            if not llm_available:
+                answers[i] = create_fallback_answer(question, job_title, i, profile)
+                fallback_count += 1
+                continue
+            
             try:
                 # Individual prompt for each question
-                prompt = f"""
-Generate a STAR method answer for this interview question:
-
-Job Title: {job_title}
-Resume Context: {resume_text[:500]}
-
-Question {i}: {question}
-
-Provide your answer in this EXACT format:
-SITUATION: [Brief description of the situation - 1-2 sentences]
-TASK: [What needed to be accomplished - 1 sentence]  
-ACTION: [Specific actions you took - 1-2 sentences]
-RESULT: [The outcome achieved - 1 sentence]
-
-Make it professional and relevant to the job title. Do not include any other text or formatting.
-"""
+                prompt = build_answer_prompt(job_title, candidate_context, i, question)
                 
                 @retry_gemini_api()
                 def generate_single_answer(model, prompt):
@@ -269,37 +246,205 @@ Make it professional and relevant to the job title. Do not include any other tex
                 answers[i] = formatted_answer
                 
                 # Small delay to avoid rate limiting
-                import time
-                time.sleep(0.3)
+                time.sleep(ANSWER_PACING_DELAY)
                 
+            except google.api_core.exceptions.GoogleAPIError as e:
+                # Gemini is unavailable (quota, outage), answer the remaining questions locally
+                print(f"Gemini unavailable at question {i}, using local fallbacks: {str(e)}")
+                llm_available = False
+                answers[i] = create_fallback_answer(question, job_title, i, profile)
+                fallback_count += 1
             except Exception as e:
                 print(f"Error generating answer for question {i}: {str(e)}")
                 # Create fallback answer to maintain order
-                answers[i] = create_fallback_answer(question, job_title, i)
+                answers[i] = create_fallback_answer(question, job_title, i, profile)
+                fallback_count += 1
         
-        # Final check - ensure we have exactly 10 answers in order
-        final_answers = {}
-        for i in range(1, 11):
-            if i in answers:
-                final_answers[i] = answers[i]
-            else:
-                # Create missing answer
-                question_text = questions[i-1] if i <= len(questions) else "General interview question"
-                final_answers[i] = create_fallback_answer(question_text, job_title, i)
+        return jsonify(answers_response(answers, questions, job_title, profile, fallback_count))
         
-        return jsonify({
-            'success': True,
-            'structured_answers': final_answers,
-            'total_questions': 10,
-            'method_used': 'STAR Method'
-        })
-        
-    except google.api_core.exceptions.ResourceExhausted as e:
-        return jsonify({'error': "API quota exceeded for answer generation. Please check your Google Cloud Console for usage limits or try again later."})
-    except google.api_core.exceptions.GoogleAPIError as e:
-        return jsonify({'error': f"Google API error during answer generation: {str(e)}. Please try again."})
     except Exception as e:
-        return jsonify({'error': f'An unexpected error occurred during answer generation: {str(e)}'})
+        return jsonify({'error': answer_error(e)})
+
+# Steps shared by the sync routes above and the async routes in asgi.py
+
+API_KEY_MISSING_MESSAGE = "API key not configured. Please set GEMINI_API_KEY environment variable."
+NOT_RESUME_MESSAGE = "The uploaded document doesn't appear to be a resume. Please upload a valid resume."
+NO_QUESTIONS_MESSAGE = "No questions found. Please generate questions first."
+
+def read_upload_form(files, form):
+    """Return (file, job_title, error message) from the upload form"""
+    if 'pdf_file' not in files:
+        return None, '', "No file uploaded"
+                
+    file = files['pdf_file']
+    job_title = form.get('job_title', '')
+                
+    if not file.filename or not job_title:
+        return None, job_title, "Please select file and job title"
+    return file, job_title, None
+
+def check_resume_text(text_content):
+    """Error message for extracted text that shouldn't go to Gemini, None if it can"""
+    if not text_content.strip():
+        return "Could not extract text from PDF. Please ensure it's a readable PDF."
+                
+    # Reject obvious non-resumes locally before spending a Gemini call
+    if resume_filter.check_resume(text_content) == resume_filter.NOT_RESUME:
+        return NOT_RESUME_MESSAGE
+    return None
+
+def questions_from_response(response_text):
+    """Return (questions, error message) from the combined validation and questions response"""
+    # Parse validation result
+    if "NOT_RESUME" in response_text:
+        resume_filter.record_llm_rejection()
+        return [], NOT_RESUME_MESSAGE
+                
+    questions = parse_questions(response_text)
+                
+    if len(questions) < 5:
+        return questions, "Could not generate sufficient questions. Please try with a different resume or job title."
+    return questions, None
+
+def store_questions(session, questions, job_title, profile, text_content):
+    """Store in session with reduced context"""
+    session['questions'] = questions
+    session['job_title'] = job_title
+    session['resume_profile'] = profile  # Reused by answers and fallbacks
+    # Raw context only for resumes the profile vocabularies miss
+    session['resume_text'] = text_content[:500] if resume_profile.is_sparse(profile) else ''
+
+def question_error(e):
+    """Return (error message, status) for an exception raised while generating questions"""
+    if isinstance(e, PDFUploadRejected):
+        return e.description, 400
+    if isinstance(e, google.api_core.exceptions.ResourceExhausted):
+        return "API quota exceeded. Please check your Google Cloud Console for usage limits or try again later.", 200
+    if isinstance(e, google.api_core.exceptions.GoogleAPIError):
+        return f"Google API error: {str(e)}. Please try again.", 200
+    return f"An unexpected error occurred: {str(e)}. Please try again.", 200
+
+def load_answer_context(session):
+    """Return (questions, job_title, profile, candidate context for the answer prompts) from the session"""
+    resume_text = session.get('resume_text', '')
+    # Sessions created before profiles were stored only have the raw text
+    profile = session.get('resume_profile') or resume_profile.build_profile(resume_text)
+    return session.get('questions', []), session.get('job_title', ''), profile, build_candidate_context(profile, resume_text)
+
+def answers_response(answers, questions, job_title, profile, fallback_count):
+    """JSON payload with exactly 10 answers in order"""
+    final_answers, padded_count = complete_answers(answers, questions, job_title, profile)
+    return {
+        'success': True,
+        'structured_answers': final_answers,
+        'total_questions': 10,
+        'fallback_answers': fallback_count + padded_count,
+        'method_used': 'STAR Method'
+    }
+
+def answer_error(e):
+    """Error message for an exception raised while generating answers"""
+    if isinstance(e, google.api_core.exceptions.ResourceExhausted):
+        return "API quota exceeded for answer generation. Please check your Google Cloud Console for usage limits or try again later."
+    if isinstance(e, google.api_core.exceptions.GoogleAPIError):
+        return f"Google API error during answer generation: {str(e)}. Please try again."
+    return f'An unexpected error occurred during answer generation: {str(e)}'
+
+def build_questions_prompt(job_title, text_content, profile):
+    """Combined resume validation and question generation prompt"""
+    if resume_profile.is_sparse(profile):
+        # The profile missed this resume, limit text content to reduce API usage
+        resume_content = f"Resume Content: {text_content[:2500]}"  # Reduced from 4000
+    else:
+        # The profile carries the skills and projects, a short excerpt is enough to validate the document
+        resume_content = (f"Candidate Profile: {resume_profile.profile_summary(profile)}\n"
+                          f"        Resume Excerpt: {text_content[:1000]}")
+    return f"""
+        Analyze the following resume content and perform two tasks:
+        1. First, determine if this is a valid resume/CV
+        2. If valid, generate exactly 10 relevant interview questions for {job_title}
+        {resume_content}
+        RESPONSE FORMAT:
+        VALIDATION: [VALID_RESUME or NOT_RESUME with brief explanation]
+                
+        QUESTIONS:
+        1. [Question 1]
+        2. [Question 2]
+        3. [Question 3]
+        4. [Question 4]
+        5. [Question 5]
+        6. [Question 6]
+        7. [Question 7]
+        8. [Question 8]
+        9. [Question 9]
+        10. [Question 10]
+        Requirements for questions:
+        - Specific to the candidate's experience in the resume
+        - Mix of technical and behavioral questions for {job_title}
+        - Easy to Medium level but fair
+        - Based on actual projects/technologies mentioned
+        """
+
+def parse_questions(response_text):
+    """Extract up to 10 numbered questions from the QUESTIONS section"""
+    questions = []
+    lines = response_text.split('\n')
+    in_questions_section = False
+                
+    for line in lines:
+        line = line.strip()
+        if line.startswith('QUESTIONS:'):
+            in_questions_section = True
+            continue
+                        
+        if in_questions_section and line:
+            # Extract question text after number
+            if line and (line[0].isdigit() or line.startswith('Q')):
+                if '.' in line:
+                    question = line.split('.', 1)[-1].strip()
+                    if len(question) > 15:
+                        questions.append(question)
+    # Ensure we have exactly 10 questions
+    return questions[:10]
+
+def build_candidate_context(profile, resume_text):
+    """Candidate line shared by every answer prompt of a request, built once per request"""
+    if resume_text and resume_profile.is_sparse(profile):
+        return f"Resume Context: {resume_text[:500]}"
+    return f"Candidate Profile: {resume_profile.profile_summary(profile, max_length=500)}"
+
+def build_answer_prompt(job_title, candidate_context, question_num, question):
+    """Prompt for a single STAR answer"""
+    return f"""
+Generate a STAR method answer for this interview question:
+
+Job Title: {job_title}
+{candidate_context}
+
+Question {question_num}: {question}
+
+Provide your answer in this EXACT format:
+SITUATION: [Brief description of the situation - 1-2 sentences]
+TASK: [What needed to be accomplished - 1 sentence]  
+ACTION: [Specific actions you took - 1-2 sentences]
+RESULT: [The outcome achieved - 1 sentence]
+
+Make it professional and relevant to the job title. Do not include any other text or formatting.
+"""
+
+def complete_answers(answers, questions, job_title, profile=None):
+    """Return exactly 10 answers in order, filling gaps with fallbacks, and the number of gaps filled"""
+    final_answers = {}
+    padded_count = 0
+    for i in range(1, 11):
+        if i in answers:
+            final_answers[i] = answers[i]
+        else:
+            # Create missing answer
+            question_text = questions[i-1] if i <= len(questions) else "General interview question"
+            final_answers[i] = create_fallback_answer(question_text, job_title, i, profile)
+            padded_count += 1
+    return final_answers, padded_count
 
 def parse_single_answer(answer_text):
     """Parse a single answer response"""
@@ -403,36 +548,9 @@ def extract_star_simple(text):
     
     return situation, task, action, result
 
-def create_fallback_answer(question, job_title, question_num):
-    """Create a structured fallback answer"""
-    
-    # Create contextual fallback based on question content
-    question_lower = question.lower()
-    
-    if 'challenge' in question_lower or 'difficult' in question_lower:
-        situation = f"In my role as a {job_title}, I encountered a challenging situation that required immediate attention."
-        task = "I needed to resolve the issue while maintaining quality standards and meeting deadlines."
-        action = "I analyzed the problem systematically, consulted with relevant stakeholders, and implemented a step-by-step solution."
-        result = "The challenge was successfully resolved, and I gained valuable experience for handling similar situations."
-        
-    elif 'team' in question_lower or 'collaborate' in question_lower:
-        situation = f"While working as a {job_title}, I was part of a diverse team working on an important project."
-        task = "I needed to ensure effective collaboration and contribute to achieving our team objectives."
-        action = "I actively participated in team discussions, shared my expertise, and supported colleagues when needed."
-        result = "Our team successfully completed the project on time and received positive feedback from stakeholders."
-        
-    elif 'learn' in question_lower or 'new' in question_lower:
-        situation = f"In my position as a {job_title}, I encountered a situation requiring skills I hadn't used before."
-        task = "I needed to quickly acquire new knowledge and apply it effectively to meet project requirements."
-        action = "I dedicated time to research, sought guidance from experts, and practiced the new skills systematically."
-        result = "I successfully mastered the new skills and applied them to deliver quality results."
-        
-    else:
-        # Generic fallback
-        situation = f"During my experience as a {job_title}, I faced a situation that required professional judgment and action."
-        task = "I needed to address the situation effectively while maintaining high standards."
-        action = "I approached the challenge methodically, gathered necessary information, and implemented appropriate solutions."
-        result = "The situation was resolved successfully, contributing to positive outcomes for the organization."
+def create_fallback_answer(question, job_title, question_num, profile=None):
+    """Create a structured fallback answer from the local STAR template engine"""
+    situation, task, action, result = fallback_engine.create_fallback_star(question, job_title, question_num, profile)
     
     return f"""
 <strong>Situation:</strong> {situation}<br>
@@ -442,22 +560,19 @@ def create_fallback_answer(question, job_title, question_num):
 """
 @app.route('/how_to_use')
 def how_to_use():
-    return render_template('how_to_use.html')
+    return render_cached_page('how_to_use.html')
 
 @app.errorhandler(404)
 def not_found_error(error):
-    return render_template('predict.html', error="Page not found"), 404
+    return render_cached_page('predict.html', error="Page not found", status=404)
 
 @app.errorhandler(500)
 def internal_error(error):
-    return render_template('predict.html', error="Internal server error occurred"), 500
-
-# File size limit
-app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024  # 5MB limit
+    return render_cached_page('predict.html', error="Internal server error occurred", status=500)
 
 @app.errorhandler(413)
 def too_large(e):
-    return render_template('predict.html', error="File too large. Please upload a file smaller than 5MB."), 413
+    return render_cached_page('predict.html', error="File too large. Please upload a file smaller than 5MB.", status=413)
 
 if __name__ == '__main__':
     print(f"Starting Flask app on port {PORT}")
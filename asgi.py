@@ -0,0 +1,231 @@
+import asyncio
+import os
+from functools import wraps
+
+import google.api_core.exceptions
+import google.generativeai as genai
+from quart import Quart, render_template, request, jsonify, session, make_response
+from quart.wrappers import Request
+from werkzeug.exceptions import RequestEntityTooLarge
+
+import resume_filter
+import resume_profile
+import static_cache
+from app import (API_KEY_MISSING_MESSAGE, NO_QUESTIONS_MESSAGE, PORT, answer_error, answers_response,
+                 build_answer_prompt, build_questions_prompt, check_rate_limit, check_resume_text,
+                 create_fallback_answer, extract_pdf_text, load_answer_context, parse_single_answer,
+                 question_error, questions_from_response, read_upload_form, store_questions)
+from pdf_upload import MAX_UPLOAD_SIZE, pdf_stream_factory
+
+# Async serving mode: same routes as app.py, but Gemini calls are awaited so a
+# handful of processes can keep hundreds of generations in flight.
+# Run with: hypercorn asgi:app --bind 0.0.0.0:$PORT
+
+ANSWER_CONCURRENCY = 3  # Gemini calls in flight per /generate_answers request
+
+
+class PDFUploadQuartRequest(Request):
+    """Quart request that streams file parts into PDFUploadStream"""
+
+    def make_form_data_parser(self):
+        return self.form_data_parser_class(
+            stream_factory=pdf_stream_factory,
+            max_content_length=self.max_content_length,
+            cls=self.parameter_storage_class,
+        )
+
+
+app = Quart(__name__)
+app.secret_key = os.environ.get('SECRET_KEY', 'render-secret-key-123')
+app.request_class = PDFUploadQuartRequest
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_SIZE
+
+# Rendered pages for the static-content routes and the error pages
+PAGE_CACHE = static_cache.PageCache(os.path.join(app.root_path, app.template_folder))
+
+
+async def render_cached_page(template_name, error=None, status=200):
+    """Render a template once per error message and serve it with ETag/Last-Modified"""
+    entry = PAGE_CACHE.get(template_name, error)
+    if entry is None:
+        entry = PAGE_CACHE.put(template_name, error, await render_template(template_name, error=error))
+    body, etag, last_modified = entry
+    response = await make_response(body, status)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    if status == 200:
+        # Answers If-None-Match / If-Modified-Since with 304
+        response = await response.make_conditional(request)
+    return response
+
+
+def rate_limit_decorator(f):
+    @wraps(f)
+    async def decorated_function(*args, **kwargs):
+        client_ip = request.headers.get('X-Forwarded-For', request.remote_addr or 'unknown')
+        time_to_wait = check_rate_limit(client_ip)
+        if time_to_wait is not None:
+            return await render_template('predict.html',
+                                         error=f"Too many requests. Please wait {time_to_wait} seconds before making another request.")
+
+        return await f(*args, **kwargs)
+    return decorated_function
+
+
+def retry_gemini_api_async(max_retries=3, initial_delay=1):
+    def decorator(f):
+        @wraps(f)
+        async def wrapper(*args, **kwargs):
+            retries = 0
+            delay = initial_delay
+            while True:
+                try:
+                    return await f(*args, **kwargs)
+                except (google.api_core.exceptions.ResourceExhausted, # Quota exceeded
+                        google.api_core.exceptions.InternalServerError) as e: # Transient server error
+                    retries += 1
+                    print(f"Gemini API call failed (retry {retries}/{max_retries}): {e}")
+                    if retries >= max_retries:
+                        raise # Re-raise if max retries reached
+                    await asyncio.sleep(delay)
+                    delay *= 2 # Exponential backoff
+        return wrapper
+    return decorator
+
+
+@retry_gemini_api_async()
+async def generate_content_async(model, prompt):
+    return await model.generate_content_async(prompt)
+
+
+@app.route('/')
+async def index():
+    return await render_cached_page('front.html')
+
+@app.route('/test')
+async def test():
+    return f"Quart is working! Port: {PORT} 🚀"
+
+@app.route('/api/health')
+async def health():
+    return jsonify({
+        'status': 'healthy',
+        'platform': 'render',
+        'mode': 'asgi',
+        'port': PORT,
+        'env_vars': {
+            'PORT': os.environ.get('PORT', 'Not set'),
+            'GEMINI_API_KEY': 'Set' if os.environ.get('GEMINI_API_KEY') else 'Not set'
+        },
+        'resume_filter': resume_filter.FILTER_STATS
+    })
+
+@app.route('/predict')
+async def predict():
+    return await render_cached_page('predict.html')
+
+@app.route('/generate_questions', methods=['POST'])
+@rate_limit_decorator
+async def generate_questions():
+    try:
+        api_key = os.environ.get('GEMINI_API_KEY')
+        if not api_key:
+            return await render_template('predict.html', error=API_KEY_MISSING_MESSAGE)
+
+        file, job_title, error = read_upload_form(await request.files, await request.form)
+        if error:
+            return await render_template('predict.html', error=error)
+
+        genai.configure(api_key=api_key)
+        model = genai.GenerativeModel("gemini-2.5-flash")
+
+        # PDF parsing is CPU bound, keep it off the event loop
+        try:
+            text_content = await asyncio.to_thread(extract_pdf_text, file)
+        except Exception as pdf_error:
+            return await render_template('predict.html', error=f"Error reading PDF file: {str(pdf_error)}")
+
+        error = check_resume_text(text_content)
+        if error:
+            return await render_template('predict.html', error=error)
+
+        # Extract skills, technologies, roles and projects once per upload
+        profile = resume_profile.build_profile(text_content)
+
+        response = await generate_content_async(model, build_questions_prompt(job_title, text_content, profile))
+
+        questions, error = questions_from_response(response.text)
+        if error:
+            return await render_template('predict.html', error=error)
+
+        store_questions(session, questions, job_title, profile, text_content)
+
+        return await render_template('questions_result.html',
+                                     questions=questions,
+                                     job_title=job_title)
+
+    except RequestEntityTooLarge:
+        raise # Handled by the 413 error page
+    except Exception as e:
+        error, status = question_error(e)
+        return await render_template('predict.html', error=error), status
+
+@app.route('/generate_answers', methods=['POST'])
+@rate_limit_decorator
+async def generate_answers():
+    try:
+        questions, job_title, profile, candidate_context = load_answer_context(session)
+
+        if not questions:
+            return jsonify({'error': NO_QUESTIONS_MESSAGE})
+
+        # Without an API key every answer comes from the local fallback engine
+        api_key = os.environ.get('GEMINI_API_KEY')
+        llm_state = {'available': bool(api_key)}
+        if api_key:
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel("gemini-2.5-flash")
+
+        # Answers are generated concurrently, bounded to avoid Gemini rate limits
+        semaphore = asyncio.Semaphore(ANSWER_CONCURRENCY)
+
+        async def answer_question(i, question):
+            try:
+                async with semaphore:
+                    if llm_state['available']:
+                        response = await generate_content_async(model, build_answer_prompt(job_title, candidate_context, i, question))
+                        return parse_single_answer(response.text.strip()), False
+            except google.api_core.exceptions.GoogleAPIError as e:
+                # Gemini is unavailable (quota, outage), answer the remaining questions locally
+                print(f"Gemini unavailable at question {i}, using local fallbacks: {str(e)}")
+                llm_state['available'] = False
+            except Exception as e:
+                print(f"Error generating answer for question {i}: {str(e)}")
+            # Create fallback answer to maintain order
+            return create_fallback_answer(question, job_title, i, profile), True
+
+        results = await asyncio.gather(*(answer_question(i, question)
+                                         for i, question in enumerate(questions[:10], 1)))
+        answers = {i: answer for i, (answer, _) in enumerate(results, 1)}
+        fallback_count = sum(1 for _, is_fallback in results if is_fallback)
+
+        return jsonify(answers_response(answers, questions, job_title, profile, fallback_count))
+
+    except Exception as e:
+        return jsonify({'error': answer_error(e)})
+
+@app.route('/how_to_use')
+async def how_to_use():
+    return await render_cached_page('how_to_use.html')
+
+@app.errorhandler(404)
+async def not_found_error(error):
+    return await render_cached_page('predict.html', error="Page not found", status=404)
+
+@app.errorhandler(500)
+async def internal_error(error):
+    return await render_cached_page('predict.html', error="Internal server error occurred", status=500)
+
+@app.errorhandler(413)
+async def too_large(e):
+    return await render_cached_page('predict.html', error="File too large. Please upload a file smaller than 5MB.", status=413)
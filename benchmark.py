@@ -0,0 +1,148 @@
+import argparse
+import asyncio
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import google.generativeai as genai
+from werkzeug.datastructures import FileStorage
+
+import app as sync_mode
+import asgi as async_mode
+import resume_filter
+
+# Offline throughput benchmark for the sync (WSGI) and async (ASGI) serving modes.
+# Gemini is replaced by a fake model with a fixed latency, so no API key or network is needed.
+# The deployed modes differ in more than the server: sync sleeps ANSWER_PACING_DELAY
+# between answers and async answers ANSWER_CONCURRENCY questions at once, so each
+# effect is measured on its own as well as the two deployed configurations.
+# Usage: python benchmark.py --users 16 --latency 0.2 --workers 4
+
+FAKE_QUESTIONS = "VALIDATION: VALID_RESUME\n\nQUESTIONS:\n" + "\n".join(
+    f"{i}. Can you walk me through project number {i} on your resume?" for i in range(1, 11))
+FAKE_ANSWER = ("SITUATION: Our service was slow.\nTASK: Make it faster.\n"
+               "ACTION: I profiled and cached hot paths.\nRESULT: Latency dropped by half.")
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    latency = 0.2
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def _respond(self, prompt):
+        return FakeResponse(FAKE_QUESTIONS if 'QUESTIONS:' in prompt else FAKE_ANSWER)
+
+    def generate_content(self, prompt):
+        time.sleep(self.latency)
+        return self._respond(prompt)
+
+    async def generate_content_async(self, prompt):
+        await asyncio.sleep(self.latency)
+        return self._respond(prompt)
+
+
+def make_resume_pdf():
+    """Build a one page text PDF from the first labelled resume sample"""
+    text = next(sample['text'] for sample in resume_filter.load_samples() if sample['label'] == 1)
+    lines = [line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+             for line in text.encode('latin-1', 'replace').decode('latin-1').splitlines()]
+    content = "BT /F1 10 Tf 50 750 Td 12 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(content)} >>\nstream\n{content}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n".encode('latin-1')
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    pdf += f"trailer << /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF".encode()
+    return pdf
+
+
+def run_sync_user(pdf):
+    client = sync_mode.app.test_client()
+    response = client.post('/generate_questions', content_type='multipart/form-data', data={
+        'job_title': 'Software Engineer',
+        'pdf_file': (io.BytesIO(pdf), 'resume.pdf'),
+    })
+    assert response.status_code == 200 and b'walk me through' in response.data, "question generation failed"
+    response = client.post('/generate_answers')
+    assert response.get_json().get('success'), response.get_json()
+
+
+async def run_async_user(pdf):
+    client = async_mode.app.test_client()
+    response = await client.post('/generate_questions', form={'job_title': 'Software Engineer'}, files={
+        'pdf_file': FileStorage(io.BytesIO(pdf), filename='resume.pdf', content_type='application/pdf'),
+    })
+    assert response.status_code == 200 and b'walk me through' in await response.get_data(), "question generation failed"
+    response = await client.post('/generate_answers')
+    assert (await response.get_json()).get('success')
+
+
+def bench_sync(pdf, users, workers):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda _: run_sync_user(pdf), range(users)))
+    return time.perf_counter() - start
+
+
+def bench_async(pdf, users):
+    async def run_all():
+        await asyncio.gather(*(run_async_user(pdf) for _ in range(users)))
+
+    start = time.perf_counter()
+    asyncio.run(run_all())
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sync and async serving throughput offline")
+    parser.add_argument('--users', type=int, default=16, help="users doing questions + answers")
+    parser.add_argument('--latency', type=float, default=0.2, help="simulated Gemini latency in seconds")
+    parser.add_argument('--workers', type=int, default=4, help="sync worker count to simulate")
+    args = parser.parse_args()
+
+    os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+    genai.configure = lambda **kwargs: None
+    genai.GenerativeModel = FakeModel
+    FakeModel.latency = args.latency
+    sync_mode.RATE_LIMIT_MAX_REQUESTS = float('inf')
+
+    pdf = make_resume_pdf()
+    requests_made = args.users * 2
+    pacing, concurrency = sync_mode.ANSWER_PACING_DELAY, async_mode.ANSWER_CONCURRENCY
+
+    def report(label, elapsed):
+        print(f"- {label}: {elapsed:.2f}s, {requests_made / elapsed:.2f} req/s")
+
+    print(f"{args.users} users, {requests_made} requests, {args.latency}s simulated Gemini latency")
+
+    report(f"Sync, {args.workers} workers, {pacing}s pacing (deployed)", bench_sync(pdf, args.users, args.workers))
+    sync_mode.ANSWER_PACING_DELAY = 0
+    report(f"Sync, {args.workers} workers, no pacing", bench_sync(pdf, args.users, args.workers))
+
+    # Same per-request work as the line above, only the serving mode differs
+    async_mode.ANSWER_CONCURRENCY = 1
+    report("Async, 1 process, answers one at a time", bench_async(pdf, args.users))
+    async_mode.ANSWER_CONCURRENCY = concurrency
+    report(f"Async, 1 process, {concurrency} answers at a time (deployed)", bench_async(pdf, args.users))
+
+
+if __name__ == '__main__':
+    main()
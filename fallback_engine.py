@@ -0,0 +1,346 @@
+import html
+import json
+import os
+import re
+
+import resume_profile
+
+# Deterministic STAR answers used when Gemini is unavailable.
+# Questions are classified against a trie of stemmed keywords built once at import from a
+# taxonomy of question types, extended with the phrasing of the questions in
+# model/interview_questions.json, then a STAR template for that type is filled
+# with skills and projects from the resume profile.
+
+QUESTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model', 'interview_questions.json')
+
+TOKEN_RE = re.compile(r"\.?[a-z0-9+#]+(?:[.'-][a-z0-9+#]+)*")
+
+SEED_WEIGHT = 3
+DATASET_WEIGHT = 1
+WEAK_SEED_WEIGHT = 1
+
+# Question type -> seed keyword phrases. Ties go to the type with the longest
+# matched phrase, then to the earlier type in this order
+TAXONOMY = {
+    'introduction': ['tell me about yourself', 'introduce yourself', 'describe yourself', 'about yourself',
+                     'your background', 'walk me through your background', 'walk me through your resume'],
+    'strengths': ['strength', 'weakness', 'greatest strength', 'greatest weakness', 'areas of improvement',
+                  'area for improvement', 'what are you good at'],
+    'achievement': ['achievement', 'accomplishment', 'proud', 'proudest', 'biggest success', 'recognition', 'award'],
+    'challenge': ['challenge', 'challenging', 'difficult', 'obstacle', 'problem you faced', 'hardest', 'tough'],
+    'failure': ['failure', 'failed', 'mistake', 'went wrong', 'regret', 'setback'],
+    'conflict': ['conflict', 'disagree', 'disagreement', 'difficult colleague', 'difficult stakeholder', 'pushback'],
+    'teamwork': ['team', 'teammate', 'collaborate', 'collaboration', 'cross-functional', 'work with others'],
+    'leadership': ['lead', 'led', 'leadership', 'mentor', 'mentored', 'initiative', 'ownership', 'influence'],
+    'deadline': ['deadline', 'pressure', 'prioritize', 'prioritise', 'tight timeline', 'multiple tasks', 'time management'],
+    'learning': ['learn', 'learned', 'new technology', 'new skill', 'unfamiliar', 'quickly pick up', 'self-taught'],
+    'motivation': ['why do you want', 'why this role', 'motivates', 'career goals', 'five years', 'passionate', 'interest in'],
+    'project': ['project', 'walk me through', 'walk us through', 'you built', 'you developed', 'your role in'],
+    'implementation': ['implement', 'build', 'define', 'design a', 'develop', 'write a', 'management'],
+    'optimization': ['optimize', 'optimise', 'performance', 'efficient', 'efficiently', 'scale', 'scalability', 'latency', 'faster'],
+    'debugging': ['debug', 'troubleshoot', 'bug', 'issue in production', 'exceptions', 'error handling', 'root cause'],
+    'data': ['data', 'dataset', 'preprocess', 'missing data', 'clean', 'etl', 'pipeline', 'merge', 'aggregate'],
+    'comparison': ['difference', 'compare', 'versus', 'advantage', 'benefit', 'why is'],
+    'architecture': ['architecture', 'design', 'lifecycle', 'microservices', 'system design', 'structure'],
+    'testing': ['test', 'automate', 'quality', 'unit test', 'validation'],
+    'concept': ['explain', 'how does', 'concept'],
+}
+
+# Common words that hint at a type but should never outweigh a specific keyword
+WEAK_SEEDS = {
+    'implementation': ['use', 'handle', 'create', 'manage'],
+    'comparison': ['vs'],
+    'architecture': ['component'],
+    'concept': ['describe', 'what is', 'what are'],
+}
+
+# STAR templates per question type. Placeholders: job_title, skill, project, topic
+TEMPLATES = {
+    'introduction': (
+        "My recent work has centred on {project}, where I worked hands-on with {skill}.",
+        "Across my roles I have been building toward the {job_title} position, taking on more responsibility each time.",
+        "I built depth in {skill}, took ownership of {topic} and worked closely with teammates and stakeholders to deliver.",
+        "That experience prepared me well for the {job_title} role, and I am keen to bring it to your team."),
+    'strengths': (
+        "On {project}, feedback from my team showed a clear pattern in how I work.",
+        "I wanted to build on my strength with {skill} and improve the area where I was weaker, which was asking for help early enough.",
+        "I kept applying {skill} where I could have the most impact, and for the weaker area I set a personal goal, asked for regular feedback and tracked my progress.",
+        "The team came to rely on my strength, and the weaker area has improved steadily since."),
+    'achievement': (
+        "One achievement I am proud of is my work on {project}.",
+        "The goal was to deliver {topic} to a standard that made a real difference for its users.",
+        "I planned the work carefully, used {skill} for the most demanding parts and kept iterating on feedback.",
+        "The result exceeded expectations, was recognised by the team and showed me what focused ownership can achieve."),
+    'challenge': (
+        "While working on {project}, a critical part of the work built with {skill} started failing close to a release.",
+        "As the {job_title}, I had to find the root cause and ship a fix without slipping the deadline.",
+        "I reproduced the problem, narrowed it down step by step, and agreed on a short plan with the team before changing {topic}.",
+        "The fix shipped on time, and the checks I added stopped the same problem from coming back."),
+    'failure': (
+        "Early in {project}, I underestimated how much work {topic} would need.",
+        "I had to recover the schedule and be honest with the team about what went wrong.",
+        "I flagged the slip early, split the remaining work into smaller milestones and asked for an earlier review of my work with {skill}.",
+        "We delivered a little later than planned but without quality issues, and I now plan with explicit buffers."),
+    'conflict': (
+        "On {project}, a teammate and I disagreed on how to approach {topic}.",
+        "We needed to agree on one approach without hurting the working relationship or the timeline.",
+        "I listened to their reasoning, put both options side by side with their trade-offs and suggested a quick prototype with {skill} to compare them.",
+        "The prototype made the decision clear, we moved forward together and kept collaborating well."),
+    'teamwork': (
+        "In {project}, I worked with a small team where each person owned a different part of the system.",
+        "My part was {topic}, and it had to integrate cleanly with everyone else's work.",
+        "I agreed interfaces early, shared progress in short updates and helped teammates when they were blocked on {skill}.",
+        "We integrated without surprises and delivered {project} on schedule."),
+    'leadership': (
+        "During {project}, the team had no clear owner for {topic}.",
+        "As the {job_title}, I took responsibility for driving it to completion.",
+        "I broke the work into tasks, paired with less experienced teammates on the parts that used {skill} and reviewed their code.",
+        "The feature shipped on time and two teammates became confident working on {topic} on their own."),
+    'deadline': (
+        "Near the end of {project}, several tasks became due in the same week.",
+        "I had to deliver the most important work on time without cutting corners.",
+        "I ranked tasks by impact, agreed on priorities with stakeholders and focused on {topic} first using {skill}.",
+        "The critical pieces were delivered on time and the remaining work followed in the next iteration."),
+    'learning': (
+        "For {project}, I had to work with {topic}, which was new to me.",
+        "I needed to become productive with it quickly enough to meet the project timeline.",
+        "I went through the official documentation, built a small prototype and asked experienced colleagues to review my approach.",
+        "I delivered my part on time and have used {topic} confidently since."),
+    'motivation': (
+        "While building {project}, I found I enjoy the kind of problems that come with the {job_title} role.",
+        "I wanted to turn that interest into a role where I can grow and have real impact.",
+        "I strengthened my skills with {skill} through hands-on work such as {project} and kept learning about {topic}.",
+        "This role is the natural next step, and I can contribute from day one while continuing to grow."),
+    'project': (
+        "In {project}, I used {skill} to solve a concrete problem for its users.",
+        "I was responsible for designing and building the core of the solution around {topic}.",
+        "I planned the structure first, built it incrementally with {skill}, tested each part and iterated on feedback.",
+        "The project worked reliably and taught me how to take an idea all the way to delivery."),
+    'implementation': (
+        "In {project}, I needed to implement {topic} as part of the solution.",
+        "The implementation had to be correct, readable and easy for the team to maintain.",
+        "I started from the requirements, wrote the code with {skill} in small testable pieces and reviewed edge cases before integrating it.",
+        "The implementation worked as intended and was easy for others to extend later."),
+    'optimization': (
+        "In {project}, the part of the system dealing with {topic} became too slow as usage grew.",
+        "I had to improve performance without changing the behaviour users relied on.",
+        "I measured first to find the real bottleneck, then optimized the hot path using {skill} and verified the gains with benchmarks.",
+        "Response times dropped noticeably and the system handled more load on the same resources."),
+    'debugging': (
+        "While working on {project}, we hit an intermittent bug related to {topic}.",
+        "I had to find the root cause quickly and make sure it would not return.",
+        "I reproduced it reliably, added logging around the failing code and used {skill} to narrow it down until the cause was clear.",
+        "The bug was fixed, and the test I added has caught similar regressions since."),
+    'data': (
+        "In {project}, the data we received for {topic} was incomplete and inconsistent.",
+        "I needed to turn it into a clean, reliable dataset for the rest of the work.",
+        "I profiled the data, handled missing values and duplicates with {skill} and automated the steps in a repeatable pipeline.",
+        "The cleaned data improved the quality of the results and saved time on every later run."),
+    'comparison': (
+        "In {project}, we had to choose the right approach for {topic}.",
+        "I needed to compare the options and recommend one based on the project's needs.",
+        "I listed the trade-offs, built small prototypes of the main candidates with {skill} and compared them on the criteria that mattered.",
+        "We picked the option that fit best, and the decision held up as the project grew."),
+    'architecture': (
+        "When starting {project}, we had to decide how to structure the system around {topic}.",
+        "The design had to be simple to build now and easy to extend later.",
+        "I split the system into clear components with well-defined responsibilities and built them with {skill}, documenting the key decisions.",
+        "The structure made new features straightforward to add and easy for new teammates to understand."),
+    'testing': (
+        "In {project}, changes to {topic} kept breaking existing features.",
+        "I needed to make changes safe by improving our testing.",
+        "I added automated tests with {skill} for the critical paths and ran them on every change.",
+        "Regressions dropped sharply and the team could ship changes with confidence."),
+    'concept': (
+        "In {project}, understanding {topic} well was essential to getting the design right.",
+        "I needed to apply the concept correctly and explain it to the rest of the team.",
+        "I studied how {topic} works in depth, applied it in my work with {skill} and shared a short write-up with the team.",
+        "The feature behaved as expected and the team had a shared understanding of {topic}."),
+    'general': (
+        "During my work on {project} as the {job_title}, I faced a situation that required sound professional judgement.",
+        "I needed to handle it effectively while keeping quality high.",
+        "I gathered the relevant information, worked through the problem methodically with {skill} and kept stakeholders informed.",
+        "The situation was resolved successfully and the outcome helped the project move forward."),
+}
+
+STOPWORDS = {
+    'a', 'an', 'the', 'how', 'do', 'you', 'would', 'what', 'are', 'is', 'in', 'of', 'for', 'to', 'and', 'or', 'can',
+    'your', 'using', 'with', 'its', 'it', 'on', 'from', 'between', 'key', 'best', 'multiple', 'why', 'explain',
+}
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def stem(token):
+    """Strip plural and verb endings so challenge/challenges/challenged share a key"""
+    if not token.isalpha():
+        return token
+    if token.endswith('ies') and len(token) > 4:
+        return token[:-3] + 'y'
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3 and not token.endswith('ss'):
+            token = token[:-len(suffix)]
+            break
+    else:
+        if token.endswith('e') and len(token) > 3:
+            token = token[:-1]
+    # debugging -> debugg -> debug
+    if len(token) > 3 and token[-1] == token[-2] and token[-1] not in 'ls':
+        token = token[:-1]
+    return token
+
+
+class KeywordTrie:
+    """Token-level trie over stemmed tokens, finds the longest known phrase starting at each token"""
+
+    def __init__(self):
+        self.root = {}
+
+    def add(self, phrase, value):
+        node = self.root
+        for token in tokenize(phrase):
+            node = node.setdefault(stem(token), {})
+        node.setdefault(None, []).append(value)
+
+    def find(self, tokens):
+        """Yield (value, phrase length in tokens) for the longest match at each position"""
+        tokens = [stem(token) for token in tokens]
+        i = 0
+        while i < len(tokens):
+            node = self.root
+            match, match_end = None, i
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if None in node:
+                    match, match_end = node[None], j + 1
+            if match is None:
+                i += 1
+            else:
+                yield from ((value, match_end - i) for value in match)
+                i = match_end
+
+
+def _dataset_entries():
+    try:
+        with open(QUESTIONS_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def _split_questions(text):
+    return [q.strip() for q in re.split(r'(?<=[?.])\s+', text) if q.strip()]
+
+
+def build_index():
+    """Build the question type trie from the taxonomy and the dataset questions"""
+    type_trie = KeywordTrie()
+    type_names = list(TAXONOMY)
+
+    for question_type, phrases in TAXONOMY.items():
+        for phrase in phrases:
+            type_trie.add(phrase, (question_type, SEED_WEIGHT))
+    for question_type, phrases in WEAK_SEEDS.items():
+        for phrase in phrases:
+            type_trie.add(phrase, (question_type, WEAK_SEED_WEIGHT))
+
+    # Extend the taxonomy with the vocabulary of the dataset questions: every
+    # content word of a classified question becomes a weak keyword for its type
+    skill_tokens = {stem(token) for name in resume_profile.VOCABULARY for token in tokenize(name)}
+    learned = {}
+    for entry in _dataset_entries():
+        for question in _split_questions(entry['output']):
+            tokens = tokenize(question)
+            question_type = _best_type(_score(type_trie, tokens), type_names)
+            if question_type == 'general':
+                continue
+            for token in tokens:
+                if token not in STOPWORDS and len(token) > 3 and stem(token) not in skill_tokens:
+                    learned.setdefault(stem(token), set()).add(question_type)
+
+    seed_tokens = {stem(token) for seeds in (TAXONOMY, WEAK_SEEDS) for phrases in seeds.values()
+                   for phrase in phrases for token in tokenize(phrase)}
+    for token, question_types in learned.items():
+        # Words shared by several types don't say much about any of them
+        if token not in seed_tokens and len(question_types) == 1:
+            type_trie.add(token, (next(iter(question_types)), DATASET_WEIGHT))
+
+    return type_trie, type_names
+
+
+def _score(type_trie, tokens):
+    """Map question type -> (total weight, longest matched phrase)"""
+    scores = {}
+    for (question_type, weight), length in type_trie.find(tokens):
+        total, longest = scores.get(question_type, (0, 0))
+        scores[question_type] = (total + weight, max(longest, length))
+    return scores
+
+
+def _best_type(scores, type_names):
+    if not scores:
+        return 'general'
+    # Ties go to the more specific phrase, then to the earlier type
+    return max(scores, key=lambda name: (scores[name], -type_names.index(name)))
+
+
+TYPE_TRIE, TYPE_NAMES = build_index()
+
+
+def classify_question(question):
+    """Return (question_type, skills and technologies mentioned in the question)"""
+    question_type = _best_type(_score(TYPE_TRIE, tokenize(question)), TYPE_NAMES)
+    skills = [name for category, name in resume_profile.find_terms(question) if category != resume_profile.ROLE]
+    return question_type, list(dict.fromkeys(skills))
+
+
+def _pick(options, question_num, default):
+    return options[(question_num - 1) % len(options)] if options else default
+
+
+def create_fallback_star(question, job_title, question_num, profile=None):
+    """Return (situation, task, action, result) for a question, deterministic for the same inputs"""
+    profile = profile or {}
+    question_type, question_skills = classify_question(question)
+    resume_skills = profile.get(resume_profile.TECHNOLOGY, []) + profile.get(resume_profile.SKILL, [])
+    projects = profile.get('projects', [])
+
+    skill = question_skills[0] if question_skills else _pick(resume_skills, question_num, 'the tools the role required')
+    topic = question_skills[0] if question_skills else _pick(resume_skills, question_num + 1, 'the core functionality')
+    default_project = f"a {skill} project" if (question_skills or resume_skills) else "a recent project"
+    project = _pick(projects, question_num, default_project)
+
+    values = {name: html.escape(value) for name, value in
+              {'job_title': job_title or 'professional', 'skill': skill, 'topic': topic, 'project': project}.items()}
+    return tuple(part.format(**values) for part in TEMPLATES[question_type])
+
+
+if __name__ == '__main__':
+    import timeit
+    sample_resume = "SKILLS\nPython, Flask, Docker\nPROJECTS\nExpense Tracker - budgeting web app\n"
+    profile = resume_profile.build_profile(sample_resume)
+    expected = {
+        "Tell me about yourself.": 'introduction',
+        "What is your greatest weakness?": 'strengths',
+        "What are your key strengths as an engineer?": 'strengths',
+        "What achievement are you most proud of?": 'achievement',
+        "Tell me about a time you faced a difficult challenge.": 'challenge',
+        "Can you describe a project where you used React and what challenges you faced?": 'challenge',
+        "Describe a time you disagreed with your manager.": 'conflict',
+        "How do you test your React components?": 'testing',
+        "How would you optimize a slow SQL query?": 'optimization',
+        "Explain the difference between Flask and Django.": 'comparison',
+        "Walk me through your Expense Tracker project.": 'project',
+        "How do you handle missing values in a dataset?": 'data',
+    }
+    for question, question_type in expected.items():
+        result = classify_question(question)
+        print(result, '<-', question)
+        assert result[0] == question_type, f"expected {question_type} for {question!r}"
+    seconds = timeit.timeit(lambda: create_fallback_star("How do you handle missing data in Pandas?", "Data Analyst", 3, profile),
+                            number=10000) / 10000
+    print(f"Average fallback time: {seconds * 1e6:.1f} microseconds")
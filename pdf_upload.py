@@ -0,0 +1,117 @@
+import io
+import mmap
+import re
+import tempfile
+from contextlib import contextmanager
+
+from flask import Request
+from werkzeug.exceptions import BadRequest
+
+# Upload limits
+MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB limit, enforced by Werkzeug before parsing
+MAX_PDF_PAGES = 10  # Resumes longer than this are rejected from the header alone
+PDF_MAGIC = b'%PDF-'
+PDF_PEEK_SIZE = 8 * 1024  # Bytes inspected for magic bytes and page count
+UPLOAD_SPOOL_THRESHOLD = 512 * 1024  # Bigger uploads go to a temp file instead of memory
+
+# Linearized PDFs carry the page count (/N) in the first object of the file,
+# other PDFs often have the page tree root (/Type /Pages ... /Count) near the top.
+# The head may end mid-number, so a count only counts once a non-digit follows it.
+LINEARIZED_PAGES_RE = re.compile(rb'/Linearized\b(?:(?!>>).)*?/N\s+(\d+)(?=\D)', re.DOTALL)
+PAGE_TREE_RE = re.compile(rb'<<(?:(?!<<|>>).)*?/Type\s*/Pages\b(?:(?!<<|>>).)*?>>', re.DOTALL)
+PAGE_COUNT_RE = re.compile(rb'/Count\s+(\d+)(?=\D)')
+
+
+class PDFUploadRejected(BadRequest):
+    """Raised while the upload is still streaming in, so the rest of the body is never read"""
+
+
+def estimate_page_count(head):
+    """Read the page count from the first bytes of a PDF, or None if it isn't there yet"""
+    match = LINEARIZED_PAGES_RE.search(head)
+    if match:
+        return int(match.group(1))
+
+    counts = []
+    for tree in PAGE_TREE_RE.finditer(head):
+        count_match = PAGE_COUNT_RE.search(tree.group(0))
+        if count_match:
+            counts.append(int(count_match.group(1)))
+    # The root of the page tree has the largest count
+    return max(counts) if counts else None
+
+
+class PDFUploadStream:
+    """File sink for multipart uploads that validates the PDF header as it arrives.
+
+    Small uploads stay in memory; larger ones spool to a temporary file so the
+    parser can memory-map them instead of copying the body around.
+    """
+
+    def __init__(self):
+        self._file = io.BytesIO()
+        self._head = b''
+        self._magic_checked = False
+        self._pages_checked = False
+
+    def write(self, data):
+        if not self._pages_checked:
+            self._head += bytes(data[:PDF_PEEK_SIZE - len(self._head)])
+            self._check_head(complete=len(self._head) >= PDF_PEEK_SIZE)
+
+        if isinstance(self._file, io.BytesIO) and self._file.tell() + len(data) > UPLOAD_SPOOL_THRESHOLD:
+            spooled = tempfile.TemporaryFile()
+            spooled.write(self._file.getbuffer())
+            self._file = spooled
+        return self._file.write(data)
+
+    def seek(self, *args):
+        # Werkzeug rewinds the stream once the part is complete
+        self._check_head(complete=True)
+        return self._file.seek(*args)
+
+    def _check_head(self, complete):
+        if not self._magic_checked and (complete or len(self._head) >= len(PDF_MAGIC)):
+            if not self._head.startswith(PDF_MAGIC):
+                raise PDFUploadRejected("The uploaded file is not a PDF. Please upload your resume as a PDF.")
+            self._magic_checked = True
+
+        if not self._pages_checked:
+            page_count = estimate_page_count(self._head)
+            if page_count is not None and page_count > MAX_PDF_PAGES:
+                raise PDFUploadRejected(
+                    f"The uploaded PDF has {page_count} pages. Please upload a resume of at most {MAX_PDF_PAGES} pages.")
+            if page_count is not None or complete:
+                self._pages_checked = True
+
+    @contextmanager
+    def open_for_parsing(self):
+        """Yield a seekable view of the upload without copying it"""
+        self._file.seek(0)
+        if isinstance(self._file, io.BytesIO):
+            yield self._file
+            return
+
+        mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+def pdf_stream_factory(total_content_length, content_type, filename=None, content_length=None):
+    """Werkzeug-style stream factory for multipart file parts"""
+    if not filename:
+        # Empty file input, let the route report the missing file
+        return io.BytesIO()
+    return PDFUploadStream()
+
+
+class PDFUploadRequest(Request):
+    """Request class that streams file parts into PDFUploadStream"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return pdf_stream_factory(total_content_length, content_type, filename, content_length)
@@ -0,0 +1,224 @@
+import json
+import math
+import os
+import re
+import time
+
+# Local "is this a resume" check that runs before any Gemini call.
+# Obvious non-resumes are rejected here, everything ambiguous still goes to the LLM.
+
+SAMPLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model', 'resume_samples.json')
+
+RESUME = 'resume'
+NOT_RESUME = 'not_resume'
+UNCERTAIN = 'uncertain'
+
+# Only reject when the model is very sure, false rejections cost a user, not an API call
+REJECT_THRESHOLD = 0.15
+ACCEPT_THRESHOLD = 0.85
+
+SECTION_RE = re.compile(
+    r'^[\s●•▪■◆►➢*\-–]*(?:professional\s+|work\s+|technical\s+|key\s+|academic\s+|career\s+|core\s+|personal\s+)?'
+    r'(education|academics?|experience|employment(?: history)?|work history|career history|skills|competencies|'
+    r'projects|certifications?|certificates|courses|trainings?|summary|objective|profile|internships?|achievements|'
+    r'accomplishments|awards|honou?rs|publications|qualifications|positions of responsibility|'
+    r'extra-?curricular activities|volunteer(?:ing| experience)?|languages|interests|hobbies|references|declaration)\b',
+    re.IGNORECASE | re.MULTILINE)
+EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.]+')
+PHONE_RE = re.compile(r'(?:\+\d{1,3}[\s-]?)?(?:\(\d{3}\)\s?|\d{3,5}[\s-]?)\d{3}[\s-]?\d{3,5}')
+PROFILE_LINK_RE = re.compile(r'(linkedin\.com|github\.com|behance\.net|portfolio)', re.IGNORECASE)
+DATE_RANGE_RE = re.compile(
+    r'(?:\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+|\b\d{2}/)?(?:19|20)\d{2}\s*[-–—]\s*'
+    r'(?:(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+|\d{2}/)?(?:(?:19|20)\d{2}|present|current)',
+    re.IGNORECASE)
+DEGREE_RE = re.compile(
+    r'\b(b\.?\s?tech|m\.?\s?tech|b\.?e\.|b\.?sc|m\.?sc|bachelor|master|mba|ph\.?d|diploma|bfa|cgpa|gpa)\b',
+    re.IGNORECASE)
+# Phrases that only show up in other kinds of documents. Single words that also
+# describe job duties (invoice, agenda, liability, abstract) are left out.
+NON_RESUME_RE = re.compile(
+    r'\b(invoice (?:no|number|date)|bill to|subtotal|related work|chapter \d+|exercises|dear|sincerely|'
+    r'terms and conditions|governing law|ingredients|recipe|minutes of the meeting|statement period|'
+    r'table of contents|marks\)|passenger name|booking reference|comment below)\b',
+    re.IGNORECASE)
+
+# Counters for the local filter, reported by /api/health
+FILTER_STATS = {
+    'checked': 0,
+    'rejected_locally': 0,  # Gemini calls saved
+    'accepted_locally': 0,
+    'uncertain': 0,
+    'llm_rejected': 0,  # Non-resumes the filter let through
+}
+
+
+def extract_features(text):
+    """Turn extracted resume text into a fixed-length numeric feature vector"""
+    lines = [line for line in text.splitlines() if line.strip()]
+    short_lines = sum(1 for line in lines if len(line) < 60)
+    sections = {match.group(1).lower() for match in SECTION_RE.finditer(text)}
+
+    return [
+        min(len(sections) / 4.0, 1.0),
+        1.0 if EMAIL_RE.search(text) else 0.0,
+        1.0 if PHONE_RE.search(text) else 0.0,
+        1.0 if PROFILE_LINK_RE.search(text) else 0.0,
+        min(len(DATE_RANGE_RE.findall(text)) / 2.0, 1.0),
+        1.0 if DEGREE_RE.search(text) else 0.0,
+        min(len(NON_RESUME_RE.findall(text)) / 2.0, 1.0),
+        short_lines / len(lines) if lines else 0.0,
+    ]
+
+
+def has_resume_markers(features):
+    """True if the text has any section heading, email, phone number or date range"""
+    sections, email, phone, _, date_ranges = features[:5]
+    return bool(sections or email or phone or date_ranges)
+
+
+class ResumeClassifier:
+    """Small logistic regression with a scikit-learn style fit/predict interface"""
+
+    def __init__(self, learning_rate=0.5, epochs=500, l2=0.01):
+        self.learning_rate = learning_rate
+        self.epochs = epochs
+        self.l2 = l2
+        self.coef_ = []
+        self.intercept_ = 0.0
+
+    def fit(self, X, y):
+        n_features = len(X[0])
+        self.coef_ = [0.0] * n_features
+        self.intercept_ = 0.0
+
+        for _ in range(self.epochs):
+            grad = [0.0] * n_features
+            grad_intercept = 0.0
+            for features, label in zip(X, y):
+                error = self._sigmoid(self._score(features)) - label
+                for j, value in enumerate(features):
+                    grad[j] += error * value
+                grad_intercept += error
+
+            for j in range(n_features):
+                self.coef_[j] -= self.learning_rate * (grad[j] / len(X) + self.l2 * self.coef_[j])
+            self.intercept_ -= self.learning_rate * grad_intercept / len(X)
+        return self
+
+    def predict_proba(self, X):
+        probabilities = []
+        for features in X:
+            p = self._sigmoid(self._score(features))
+            probabilities.append([1.0 - p, p])
+        return probabilities
+
+    def predict(self, X):
+        return [1 if p >= 0.5 else 0 for _, p in self.predict_proba(X)]
+
+    def _score(self, features):
+        return self.intercept_ + sum(w * v for w, v in zip(self.coef_, features))
+
+    @staticmethod
+    def _sigmoid(z):
+        if z < 0:
+            return math.exp(z) / (1.0 + math.exp(z))
+        return 1.0 / (1.0 + math.exp(-z))
+
+
+def load_samples(path=SAMPLES_PATH):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def train_classifier(samples):
+    X = [extract_features(sample['text']) for sample in samples]
+    y = [sample['label'] for sample in samples]
+    return ResumeClassifier().fit(X, y)
+
+
+_classifier = None
+
+
+def get_classifier():
+    global _classifier
+    if _classifier is None:
+        _classifier = train_classifier(load_samples())
+    return _classifier
+
+
+def classify(text, classifier=None):
+    """Return (verdict, probability) where verdict is RESUME, NOT_RESUME or UNCERTAIN"""
+    classifier = classifier or get_classifier()
+    features = extract_features(text)
+    probability = classifier.predict_proba([features])[0][1]
+
+    # Never reject text with a section heading, contact details or a date range, whatever the model says
+    if probability <= REJECT_THRESHOLD and not has_resume_markers(features):
+        return NOT_RESUME, probability
+    if probability >= ACCEPT_THRESHOLD:
+        return RESUME, probability
+    return UNCERTAIN, probability
+
+
+def check_resume(text):
+    """Classify uploaded text and update the filter counters"""
+    verdict, probability = classify(text)
+    FILTER_STATS['checked'] += 1
+    if verdict == NOT_RESUME:
+        FILTER_STATS['rejected_locally'] += 1
+    elif verdict == RESUME:
+        FILTER_STATS['accepted_locally'] += 1
+    else:
+        FILTER_STATS['uncertain'] += 1
+    return verdict
+
+
+def record_llm_rejection():
+    FILTER_STATS['llm_rejected'] += 1
+
+
+def evaluate(samples):
+    """Leave-one-out precision/recall of local rejection on the labelled samples"""
+    true_rejects = false_rejects = missed_non_resumes = 0
+    sent_to_llm = 0
+    for i, sample in enumerate(samples):
+        classifier = train_classifier(samples[:i] + samples[i + 1:])
+        verdict, _ = classify(sample['text'], classifier)
+        if verdict == NOT_RESUME:
+            if sample['label'] == 0:
+                true_rejects += 1
+            else:
+                false_rejects += 1
+        else:
+            sent_to_llm += 1
+            if sample['label'] == 0:
+                missed_non_resumes += 1
+
+    rejected = true_rejects + false_rejects
+    non_resumes = true_rejects + missed_non_resumes
+    return {
+        'samples': len(samples),
+        'precision': true_rejects / rejected if rejected else 0.0,
+        'recall': true_rejects / non_resumes if non_resumes else 0.0,
+        'false_rejections': false_rejects,
+        'sent_to_llm': sent_to_llm,
+        'llm_calls_saved': rejected,
+    }
+
+
+if __name__ == '__main__':
+    samples = load_samples()
+    report = evaluate(samples)
+    print(f"Resume filter report on {report['samples']} labelled samples (leave-one-out)")
+    print(f"- Rejection precision: {report['precision']:.2f}")
+    print(f"- Rejection recall: {report['recall']:.2f}")
+    print(f"- Resumes wrongly rejected: {report['false_rejections']}")
+    print(f"- Sent to Gemini: {report['sent_to_llm']}")
+    print(f"- Gemini calls saved: {report['llm_calls_saved']}")
+
+    classifier = get_classifier()
+    start = time.perf_counter()
+    for sample in samples:
+        classify(sample['text'], classifier)
+    elapsed = (time.perf_counter() - start) / len(samples)
+    print(f"- Average classification time: {elapsed * 1e6:.0f} microseconds")
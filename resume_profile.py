@@ -0,0 +1,209 @@
+import json
+import os
+import re
+from collections import deque
+
+from resume_filter import SECTION_RE
+
+# One-time extraction of a compact profile from the uploaded resume.
+# All vocabularies are compiled into a single Aho-Corasick automaton at import,
+# so one pass over the text finds every known skill, technology and role.
+# The profile is stored in the session and reused by the prompts and the local fallbacks.
+
+QUESTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model', 'interview_questions.json')
+
+TECHNOLOGY = 'technologies'
+SKILL = 'skills'
+ROLE = 'roles'
+
+TECHNOLOGIES = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'SQL', 'NoSQL', 'C', 'C++', 'C#', 'Go', 'Golang', 'Rust', 'Kotlin',
+    'Swift', 'PHP', 'Ruby', 'R', 'Scala', 'MATLAB', 'Bash', 'HTML', 'CSS', 'Tailwind', 'Bootstrap',
+    'React', 'Angular', 'Vue.js', 'Next.js', 'Node.js', 'Express', 'Django', 'Flask', 'FastAPI', 'Spring Boot',
+    'Laravel', 'Rails', '.NET', 'Android', 'iOS', 'Flutter', 'React Native',
+    'Pandas', 'NumPy', 'Scikit-learn', 'TensorFlow', 'PyTorch', 'Keras', 'OpenCV', 'spaCy', 'Matplotlib', 'PySpark',
+    'Spark', 'Hadoop', 'Kafka', 'Airflow', 'Selenium', 'BeautifulSoup',
+    'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite', 'Oracle', 'DynamoDB', 'Firebase',
+    'Docker', 'Kubernetes', 'Terraform', 'Ansible', 'Jenkins', 'GitHub Actions', 'Git', 'Linux',
+    'AWS', 'Azure', 'GCP', 'AWS Lambda', 'Power BI', 'Tableau', 'Excel', 'Figma', 'Sketch', 'Jira',
+]
+
+SKILLS = [
+    'Machine Learning', 'Deep Learning', 'NLP', 'Natural Language Processing', 'Computer Vision', 'Data Analysis',
+    'Data Visualization', 'Data Structures', 'Algorithms', 'Statistics', 'Data Warehousing', 'ETL',
+    'REST APIs', 'Microservices', 'System Design', 'Object-Oriented Programming', 'Multithreading',
+    'Embedded Systems', 'Operating Systems', 'Systems Programming', 'Networking', 'Cloud Computing', 'CI/CD',
+    'DevOps', 'Unit Testing', 'Automation Testing', 'Agile', 'Scrum', 'UI/UX', 'User Research', 'Prototyping',
+    'SEO', 'Project Management', 'Leadership', 'Communication', 'Problem Solving', 'Android Development',
+    'iOS Development', 'Web Development', 'Web Scraping',
+]
+
+ROLES = [
+    'Software Engineer', 'Software Developer', 'Frontend Developer', 'Backend Developer', 'Full Stack Developer',
+    'Web Developer', 'Mobile Developer', 'Data Analyst', 'Data Scientist', 'Data Engineer', 'Big Data Engineer',
+    'Machine Learning Engineer', 'ML Engineer', 'AI Engineer', 'Computer Vision Engineer', 'Database Administrator',
+    'Systems Engineer', 'DevOps Engineer', 'Cloud Engineer', 'QA Engineer', 'Automation Tester', 'UX Designer',
+    'Product Designer', 'Product Manager', 'Project Manager', 'Business Analyst', 'Consultant', 'Team Lead',
+    'Intern', 'Software Engineering Intern', 'Research Assistant', 'Teaching Assistant',
+]
+
+PROJECTS_HEADING_RE = re.compile(r'^\s*(?:academic\s+|personal\s+|key\s+)?projects?\s*:?\s*$', re.IGNORECASE)
+PROJECT_NAME_SPLIT_RE = re.compile(r'\s+[-–—:|]\s+|\s*[(:]')
+
+MAX_PROFILE_ITEMS = 12  # Per category, keeps the session cookie and prompts small
+MIN_PROFILE_TERMS = 4  # Below this the vocabularies missed the resume (often non-tech) and prompts use raw text
+
+
+class AhoCorasick:
+    """Multi-pattern matcher over lowercased text, values are returned for every whole-word match"""
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+    def add(self, pattern, value):
+        state = 0
+        for ch in pattern.lower():
+            next_state = self.goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][ch] = next_state
+            state = next_state
+        self.output[state].append((pattern, value))
+
+    def build(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail = self.fail[state]
+                while fail and ch not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_state] = self.goto[fail].get(ch, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+        return self
+
+    def find(self, text):
+        """Return (start, end, value) for the longest non-overlapping whole-word matches"""
+        lowered = text.lower()
+        matches = []
+        state = 0
+        for i, ch in enumerate(lowered):
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+            for pattern, value in self.output[state]:
+                start, end = i - len(pattern) + 1, i + 1
+                if not _is_word(lowered, start, end):
+                    continue
+                # Very short names (C, R, Go) only count with their exact capitalisation
+                if len(pattern) <= 2 and text[start:end] != pattern:
+                    continue
+                matches.append((start, end, value))
+
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        selected = []
+        last_end = 0
+        for start, end, value in matches:
+            if start >= last_end:
+                selected.append((start, end, value))
+                last_end = end
+        return selected
+
+
+def _is_word(text, start, end):
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end] if end < len(text) else ' '
+    return not (before.isalnum() or after.isalnum() or after in '+#')
+
+
+def _dataset_vocabulary():
+    """Skills and roles listed in model/interview_questions.json"""
+    try:
+        with open(QUESTIONS_PATH, 'r') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return [], []
+
+    skills, roles = [], []
+    for entry in entries:
+        skills_part, _, role_part = entry['input'].partition('|')
+        skills.extend(skill.strip() for skill in skills_part.split(':', 1)[-1].split(','))
+        roles.append(role_part.split(':', 1)[-1].strip())
+    return [skill for skill in skills if skill], [role for role in roles if role]
+
+
+def build_matcher():
+    matcher = AhoCorasick()
+    seen = set()
+    dataset_skills, dataset_roles = _dataset_vocabulary()
+    vocabularies = [(ROLE, ROLES + dataset_roles), (SKILL, SKILLS), (TECHNOLOGY, TECHNOLOGIES + dataset_skills)]
+    for category, names in vocabularies:
+        for name in names:
+            if name.lower() not in seen:
+                seen.add(name.lower())
+                matcher.add(name, (category, name))
+    return matcher.build(), seen
+
+
+MATCHER, VOCABULARY = build_matcher()
+
+
+def find_terms(text):
+    """Known (category, name) pairs in text, in order of appearance"""
+    return [value for _, _, value in MATCHER.find(text)]
+
+
+def extract_projects(resume_text):
+    """Project names from the lines under a Projects heading"""
+    projects = []
+    in_projects = False
+    for line in resume_text.splitlines():
+        line = line.strip(' \t•-*')
+        if not line:
+            continue
+        if PROJECTS_HEADING_RE.match(line):
+            in_projects = True
+            continue
+        if in_projects:
+            if len(line) <= 40 and SECTION_RE.match(line):
+                break
+            name = PROJECT_NAME_SPLIT_RE.split(line, 1)[0].strip()
+            if 2 < len(name) <= 60:
+                projects.append(name)
+    return projects
+
+
+def build_profile(resume_text):
+    """Compact, JSON-serialisable profile of a resume"""
+    profile = {TECHNOLOGY: [], SKILL: [], ROLE: [], 'projects': []}
+    for category, name in find_terms(resume_text):
+        if name not in profile[category] and len(profile[category]) < MAX_PROFILE_ITEMS:
+            profile[category].append(name)
+    profile['projects'] = list(dict.fromkeys(extract_projects(resume_text)))[:MAX_PROFILE_ITEMS]
+    return profile
+
+
+def is_sparse(profile):
+    """True when too few terms were found for the profile to stand in for the resume text"""
+    return sum(len(profile.get(key, [])) for key in (TECHNOLOGY, SKILL, ROLE, 'projects')) < MIN_PROFILE_TERMS
+
+
+def profile_summary(profile, max_length=None):
+    """Short text form of the profile for prompts and retrieval queries, cut at an item boundary"""
+    labels = [(ROLE, 'Roles'), (TECHNOLOGY, 'Technologies'), (SKILL, 'Skills'), ('projects', 'Projects')]
+    parts = []
+    length = -1  # The first line has no leading newline
+    for key, label in labels:
+        for i, item in enumerate(profile.get(key) or []):
+            part = f"\n{label}: {item}" if i == 0 else f", {item}"
+            if max_length is not None and length + len(part) > max_length:
+                return ''.join(parts).lstrip('\n')
+            parts.append(part)
+            length += len(part)
+    return ''.join(parts).lstrip('\n')
@@ -0,0 +1,36 @@
+import hashlib
+import os
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+# Caching for static content: pages whose output depends only on the template
+# and the error message are rendered once and served with ETag/Last-Modified.
+
+
+class PageCache:
+    """Rendered HTML for templates whose output depends only on the template file and the error message"""
+
+    def __init__(self, template_folder, maxsize=64):
+        self.template_folder = template_folder
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, template_name, error=None):
+        """Return (body, etag, last_modified) or None if it needs rendering"""
+        key = (template_name, error, self._mtime(template_name))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, template_name, error, body):
+        mtime = self._mtime(template_name)
+        entry = (body, hashlib.md5(body.encode('utf-8')).hexdigest(), datetime.fromtimestamp(mtime, timezone.utc))
+        self._entries[(template_name, error, mtime)] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def _mtime(self, template_name):
+        # Keyed on mtime so edited templates are picked up without a restart
+        return int(os.path.getmtime(os.path.join(self.template_folder, template_name)))